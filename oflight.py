@@ -34,9 +34,11 @@ Output Files:
 - Slot assignments: slotting.txt
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import logging
+import re
 import sys
 from typing import Optional, Dict, Any, List
 from pathlib import Path
@@ -54,35 +56,61 @@ DATE_FACTOR = 1          # Points per month since last powered flight
 
 # Required columns in input CSV
 REQUIRED_COLUMNS = {'Miles', 'Textbox39', 'Textbox25', 'GroupType', 'Joined'}
-
-def parse_date(date_str: str) -> Optional[datetime]:
-    """
-    Parses a date string into a datetime object.
-    """
-    try:
-        # Handle dates in MMM-YY format (e.g., "Mar-25")
-        if len(date_str.split('-')) == 2:
-            return datetime.strptime(date_str + "-01", "%b-%y-%d")
-        # Handle dates in DD MMM YYYY format (e.g., "09 Mar 2023")
-        return datetime.strptime(date_str, "%d %b %Y")
-    except Exception as e:
-        logging.error(f"Error parsing date {date_str}: {str(e)}")
-        return None
-
-def calculate_months_since(date_str: str) -> int:
-    """
-    Calculates the number of months since a given date.
-    """
-    if not date_str:
-        return 0
-    
-    parsed_date = parse_date(date_str)
-    if not parsed_date:
-        return 0
-    
-    today = datetime.now()
-    months = (today.year - parsed_date.year) * 12 + (today.month - parsed_date.month)
-    return max(0, months)  # Ensure we don't return negative months
+REQUIRED_INDEX = pd.Index(sorted(REQUIRED_COLUMNS))
+
+# Explicit types for orientation report columns, to skip inference
+FLIGHT_COLUMNS = [f'Textbox{n}' for n in range(130, 140)]
+REPORT_DTYPES = {
+    'CAPID': 'string',
+    'GroupType': 'category',
+    'Textbox39': 'category',
+    'Textbox25': 'category',
+    **{col: 'string' for col in FLIGHT_COLUMNS}
+}
+
+# Date formats found in the orientation report, keyed by a pattern that recognizes them
+DATE_FORMATS = [
+    (re.compile(r'^[A-Za-z]{3}-\d{2}$'), '%b-%y'),            # MMM-YY (e.g., "Mar-25")
+    (re.compile(r'^\d{1,2} [A-Za-z]{3} \d{4}$'), '%d %b %Y')  # DD MMM YYYY (e.g., "09 Mar 2023")
+]
+
+# Row layout for the slotting report
+ROW_FMT = "{num:>3}  {cap:<8} {name:<30} {pts:>3}     {nxt:>1}       {last:<8}\n"
+
+# Powered flight columns after renaming
+POWERED_COLUMNS = [f'powered_{i}' for i in range(1, 6)]
+
+def parse_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parses a column of date strings into datetimes.
+    """
+    dates = dates.astype('string')
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+    unmatched = dates.notna().to_numpy(dtype=bool, copy=True)
+    # Send each value to the format it looks like rather than trying every format on every value
+    for pattern, date_format in DATE_FORMATS:
+        matches = dates.str.match(pattern).fillna(False).to_numpy(dtype=bool)
+        if not matches.any():
+            continue
+        unmatched &= ~matches
+        group = pd.to_datetime(dates[matches], format=date_format, errors='coerce')
+        parsed[matches] = group
+        for date_str in dates[matches][group.isna()]:
+            logging.error(f"Error parsing date {date_str}: does not match format '{date_format}'")
+    for date_str in dates[unmatched]:
+        logging.error(f"Error parsing date {date_str}: does not match any known date format")
+    return parsed
+
+def calculate_months_since(dates: pd.Series, today: datetime) -> pd.Series:
+    """
+    Calculates the number of months since each date in a column.
+    """
+    parsed = parse_dates(dates)
+    current = today.year * 12 + today.month
+    # Count on plain integer month indexes; unparseable dates count as zero
+    month_index = (parsed.dt.year * 12 + parsed.dt.month).fillna(current).to_numpy(dtype=np.int64)
+    # Ensure we don't return negative months
+    return pd.Series(np.maximum(current - month_index, 0), index=dates.index)
 
 def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -111,85 +139,98 @@ def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
     }
     return df.rename(columns=column_mapping)
 
-def find_last_powered_date(row: pd.Series) -> str:
+def powered_flight_mask(powered: pd.DataFrame) -> np.ndarray:
     """
-    Finds the last powered flight date in a row.
+    Flags which powered flight cells contain a recorded flight.
 
     Args:
-        row (pd.Series): A row from a DataFrame containing flight data.
+        powered (pd.DataFrame): The powered_1 through powered_5 columns.
 
     Returns:
-        str: The last powered flight date recorded.
+        np.ndarray: 2-D boolean array, True where a non-blank flight date is recorded.
     """
-    for i in range(5, 0, -1):
-        col = f'powered_{i}'
-        if pd.notna(row[col]) and row[col].strip():
-            return row[col]
-    return row['Joined']
+    # Cast in case a column with no flights at all was read as float NaN
+    stripped = powered.apply(lambda col: col.astype('string').str.strip())
+    return (stripped.notna() & stripped.ne('')).to_numpy(dtype=bool)
 
-def count_powered_flights(row: pd.Series) -> int:
+def find_last_powered_dates(powered: np.ndarray, recorded: np.ndarray, joined: pd.Series) -> np.ndarray:
     """
-    Counts the number of powered flights in a row.
+    Finds the last powered flight date for every cadet.
 
     Args:
-        row (pd.Series): A row from a DataFrame containing flight data.
+        powered (np.ndarray): 2-D object array of the powered_1 through powered_5 columns.
+        recorded (np.ndarray): Mask of recorded flights from powered_flight_mask.
+        joined (pd.Series): Join dates, used when a cadet has no powered flights.
 
     Returns:
-        int: The number of powered flights recorded.
+        np.ndarray: The last powered flight date recorded, or the join date.
     """
-    count = 0
-    for i in range(1, 6):
-        col = f'powered_{i}'
-        if pd.notna(row[col]) and row[col].strip():
-            count += 1
-    return count
+    last_idx = recorded.shape[1] - 1 - np.argmax(recorded[:, ::-1], axis=1)
+    last_dates = powered[np.arange(len(recorded)), last_idx]
+    return np.where(recorded.any(axis=1), last_dates, joined.to_numpy(dtype=object))
 
-def calculate_flight_points(row: pd.Series) -> int:
+def calculate_flight_points(df: pd.DataFrame) -> pd.Series:
     """
-    Calculates the flight points for a row.
+    Calculates the flight points for every cadet.
 
     Args:
-        row (pd.Series): A row from a DataFrame containing flight data.
+        df (pd.DataFrame): The DataFrame containing flight data and powered_count.
 
     Returns:
-        int: The flight points calculated based on the number of powered flights.
+        pd.Series: The flight points calculated based on the number of powered flights.
     """
-    if row['GroupType'] == 'No O-Flights':
-        return (5 - row['powered_count']) * FLIGHT_FACTOR + NO_FLIGHT_FACTOR
-    return (5 - row['powered_count']) * FLIGHT_FACTOR
+    no_flight_bonus = np.where(df['GroupType'].to_numpy() == 'No O-Flights', NO_FLIGHT_FACTOR, 0)
+    return (5 - df['powered_count']) * FLIGHT_FACTOR + no_flight_bonus
 
-def calculate_date_points(last_powered: str) -> int:
+def calculate_date_points(last_powered: pd.Series, today: datetime) -> pd.Series:
     """
-    Calculates the date points for a row.
+    Calculates the date points for every cadet.
 
     Args:
-        last_powered (str): The last powered flight date.
+        last_powered (pd.Series): The last powered flight dates.
+        today (datetime): The date to count months up to.
 
     Returns:
-        int: The date points calculated based on the number of months since the last flight.
+        pd.Series: The date points calculated based on the number of months since the last flight.
     """
-    months = calculate_months_since(last_powered)
+    months = calculate_months_since(last_powered, today)
     return months * DATE_FACTOR
 
-def calculate_total_points(row: pd.Series) -> int:
+def calculate_total_points(df: pd.DataFrame) -> pd.Series:
+    """
+    Calculates the total points for every cadet.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing flight_points and date_points.
+
+    Returns:
+        pd.Series: The total points calculated by adding flight points and date points.
+    """
+    return df['flight_points'] + df['date_points']
+
+def format_last_flights(df: pd.DataFrame) -> pd.Series:
     """
-    Calculates the total points for a row.
+    Formats the last powered flight date for every cadet to the MMM-YY format.
 
     Args:
-        row (pd.Series): A row from a DataFrame containing flight data.
+        df (pd.DataFrame): The DataFrame containing powered_count and last_powered.
 
     Returns:
-        int: The total points calculated by adding flight points and date points.
+        pd.Series: The last powered flight date in MMM-YY format, or an empty string if no powered flights.
     """
-    return row['flight_points'] + row['date_points']
+    last_powered = df['last_powered'].astype('string')
+    parsed = pd.to_datetime(last_powered, format='%b-%y', errors='coerce')
+    # Dates that don't parse are shown as recorded
+    formatted = parsed.dt.strftime('%b-%y').fillna(last_powered)
+    return formatted.where(df['powered_count'] > 0, '')
 
 def validate_dataframe(df: pd.DataFrame) -> None:
     """
     Validates that the DataFrame has all required columns.
     """
-    missing_columns = REQUIRED_COLUMNS - set(df.columns)
-    if missing_columns:
-        raise ValueError(f"Missing required columns: {missing_columns}")
+    missing_columns = REQUIRED_INDEX.difference(df.columns)
+    if len(missing_columns):
+        raise ValueError(f"Missing required columns: {list(missing_columns)}")
 
 def process_data(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -201,16 +242,23 @@ def process_data(df: pd.DataFrame) -> pd.DataFrame:
     # Rename columns for clarity
     df = rename_columns(df)
     
-    # Calculate powered flight count for each cadet
-    df['powered_count'] = df.apply(count_powered_flights, axis=1)
+    # Take the current date once so every cadet is scored against the same month
+    today = datetime.now()
+    
+    # Calculate powered flight count for each cadet, sharing one mask of
+    # recorded flights with the last powered date lookup
+    powered = df[POWERED_COLUMNS]
+    recorded = powered_flight_mask(powered)
+    df['powered_count'] = recorded.sum(axis=1)
     
     # Find last powered flight date
-    df['last_powered'] = df.apply(find_last_powered_date, axis=1)
+    df['last_powered'] = find_last_powered_dates(powered.to_numpy(dtype=object), recorded, df['Joined'])
+    df['last_flight'] = format_last_flights(df)
     
     # Calculate points
-    df['flight_points'] = df.apply(calculate_flight_points, axis=1)
-    df['date_points'] = df['last_powered'].apply(calculate_date_points)
-    df['total_points'] = df.apply(calculate_total_points, axis=1)
+    df['flight_points'] = calculate_flight_points(df)
+    df['date_points'] = calculate_date_points(df['last_powered'], today)
+    df['total_points'] = calculate_total_points(df)
     
     # Sort by total points (descending)
     return df.sort_values('total_points', ascending=False)
@@ -226,41 +274,37 @@ def read_cadet_list(filename: str) -> List[str]:
         List[str]: A list of unique CAP IDs.
     """
     try:
-        with open(filename, 'r') as f:
-            cap_ids = []
-            seen = set()
-            for line in f:
-                cap_id = line.strip()
-                if cap_id and cap_id not in seen:
-                    cap_ids.append(cap_id)
-                    seen.add(cap_id)
-        return cap_ids
+        lines = Path(filename).read_text().splitlines()
+        # dict.fromkeys drops duplicates and keeps first-seen order
+        return list(dict.fromkeys(line.strip() for line in lines if line.strip()))
     except Exception as e:
         print(f"Error reading cadet list: {e}")
         return []
 
-def format_last_flight(row: pd.Series) -> str:
+def format_slotting_rows(df: pd.DataFrame, start: int) -> str:
     """
-        Formats the last powered flight date in a row to the MMM-YY format.
+    Formats cadets as numbered rows of the slotting report.
 
     Args:
-        row (pd.Series): A row from a DataFrame containing flight data.
+        df (pd.DataFrame): The cadets to format, in report order.
+        start (int): The number given to the first row.
 
     Returns:
-        str: The last powered flight date in MMM-YY format, or an empty string if no powered flights.
-    """
-    if row['powered_count'] == 0:
-        return ""
-    
-    for i in range(5, 0, -1):
-        col = f'powered_{i}'
-        if pd.notna(row[col]) and row[col].strip():
-            try:
-                date = datetime.strptime(row[col], "%b-%y")
-                return date.strftime("%b-%y")
-            except:
-                return row[col]
-    return ""
+        str: One ROW_FMT line per cadet.
+    """
+    # Pull each column out once instead of building a Series per row
+    rows = zip(
+        range(start, start + len(df)),
+        df['CAPID'].to_numpy(),
+        df['FullName'].to_numpy(),
+        df['total_points'].to_numpy(),
+        df['powered_count'].to_numpy() + 1,
+        df['last_flight'].fillna('').to_numpy()
+    )
+    return "".join(
+        ROW_FMT.format(num=num, cap=cap, name=name, pts=pts, nxt=nxt, last=last)
+        for num, cap, name, pts, nxt, last in rows
+    )
 
 def write_slotting_results(filename: str, sorted_df: pd.DataFrame, unmatched_ids: List[str], slot_count: Optional[int] = None) -> None:
     """
@@ -273,47 +317,37 @@ def write_slotting_results(filename: str, sorted_df: pd.DataFrame, unmatched_ids
         slot_count (Optional[int]): Number of primary slots to write.
     """
     try:
-        with open(filename, 'w') as f:
-            header = f"{'#':>3}  {'CAPID':<8} {'Name':<30} {'Points':>3}  {'Next':>4}  {'Last Flight':<8}\n"
-            if slot_count and len(sorted_df) > slot_count:
-                # Write primary slots
-                f.write("Primary Slots:\n")
-                f.write("=" * 70 + "\n")
-                f.write(header)
-                primary_df = sorted_df.head(slot_count)
-                for i, (_, row) in enumerate(primary_df.iterrows(), 1):
-                    next_flight = row['powered_count'] + 1
-                    last_flight = format_last_flight(row)
-                    f.write(f"{i:>3}  {row['CAPID']:<8} {row['FullName']:<30} {row['total_points']:>3}     {next_flight:>1}       {last_flight:<8}\n")
-                
-                # Write alternates
-                f.write("\nAlternates:\n")
-                f.write("=" * 70 + "\n")
-                f.write(header)
-                alternates_df = sorted_df.iloc[slot_count:]
-                for i, (_, row) in enumerate(alternates_df.iterrows(), slot_count + 1):
-                    next_flight = row['powered_count'] + 1
-                    last_flight = format_last_flight(row)
-                    f.write(f"{i:>3}  {row['CAPID']:<8} {row['FullName']:<30} {row['total_points']:>3}     {next_flight:>1}       {last_flight:<8}\n")
-            else:
-                # Write all cadets in one list
-                f.write("Cadets sorted by total points:\n")
-                f.write("=" * 70 + "\n")
-                f.write(header)
-                for i, (_, row) in enumerate(sorted_df.iterrows(), 1):
-                    next_flight = row['powered_count'] + 1
-                    last_flight = format_last_flight(row)
-                    f.write(f"{i:>3}  {row['CAPID']:<8} {row['FullName']:<30} {row['total_points']:>3}     {next_flight:>1}       {last_flight:<8}\n")
+        header = f"{'#':>3}  {'CAPID':<8} {'Name':<30} {'Points':>3}  {'Next':>4}  {'Last Flight':<8}\n"
+        lines: List[str] = []
+        if slot_count and len(sorted_df) > slot_count:
+            # Write primary slots
+            lines.append("Primary Slots:\n")
+            lines.append("=" * 70 + "\n")
+            lines.append(header)
+            lines.append(format_slotting_rows(sorted_df.iloc[:slot_count], 1))
             
-            if unmatched_ids:
-                f.write("\nUnmatched CAP IDs:\n")
-                f.write("=" * 20 + "\n")
-                for cap_id in unmatched_ids:
-                    f.write(f"{cap_id}\n")
+            # Write alternates
+            lines.append("\nAlternates:\n")
+            lines.append("=" * 70 + "\n")
+            lines.append(header)
+            lines.append(format_slotting_rows(sorted_df.iloc[slot_count:], slot_count + 1))
+        else:
+            # Write all cadets in one list
+            lines.append("Cadets sorted by total points:\n")
+            lines.append("=" * 70 + "\n")
+            lines.append(header)
+            lines.append(format_slotting_rows(sorted_df, 1))
+        
+        if unmatched_ids:
+            lines.append("\nUnmatched CAP IDs:\n")
+            lines.append("=" * 20 + "\n")
+            for cap_id in unmatched_ids:
+                lines.append(f"{cap_id}\n")
         
-        # Also print to console
-        with open(filename, 'r') as f:
-            print(f.read())
+        # Write the file in one go and send the same text to the console
+        text = "".join(lines)
+        Path(filename).write_text(text)
+        sys.stdout.write(text)
             
     except Exception as e:
         print(f"Error writing results: {e}")
@@ -327,11 +361,12 @@ def points_command():
     """
     try:
         # Read and process the orientation report
-        df = pd.read_csv("Cadet_Orientation_Report.csv")
+        df = pd.read_csv("Cadet_Orientation_Report.csv", dtype=REPORT_DTYPES)
         processed_df = process_data(df)
         
         # Save to CSV
-        processed_df.to_csv("oflight_points.csv", index=False)
+        with open("oflight_points.csv", 'w', newline='', buffering=1 << 20) as f:
+            processed_df.to_csv(f, index=False, lineterminator='\n')
         logging.info("Points calculation complete. Results saved to oflight_points.csv")
         
     except Exception as e:
@@ -349,20 +384,23 @@ def slots_command(slot_count: Optional[int] = None):
         # Read the list of CAP IDs
         cap_ids = read_cadet_list("cadet_list.txt")
         
-        # Read the points CSV
-        df = pd.read_csv("oflight_points.csv")
+        # Read the points CSV, keeping CAPID as a string for matching
+        df = pd.read_csv("oflight_points.csv", dtype={'CAPID': 'string'})
         
-        # Convert CAPID to string for matching
-        df['CAPID'] = df['CAPID'].astype(str)
+        # Filter for only the cadets in our list, keeping the points file order
+        wanted = pd.DataFrame({'CAPID': pd.unique(pd.Series(cap_ids, dtype='string'))})
+        filtered_df = df.merge(wanted, on='CAPID', how='inner')
         
-        # Filter for only the cadets in our list
-        filtered_df = df[df['CAPID'].isin(cap_ids)]
+        # Points files from older versions don't carry the formatted last flight
+        if 'last_flight' not in filtered_df:
+            filtered_df['last_flight'] = format_last_flights(filtered_df)
         
-        # Sort by total_points descending
-        sorted_df = filtered_df.sort_values('total_points', ascending=False)
+        # Sort by total_points descending; a stable sort keeps cadets with
+        # equal points in points file order
+        sorted_df = filtered_df.sort_values('total_points', ascending=False, kind='stable')
         
         # Find unmatched CAP IDs
-        matched_ids = set(filtered_df['CAPID'])
+        matched_ids = set(filtered_df['CAPID'].to_numpy())
         unmatched_ids = [id for id in cap_ids if id not in matched_ids]
         
         # Write results to file